@@ -29,7 +29,14 @@ they will contain the new contents from the swagger file.
 
 Usage is:
 
-    python build.py <path to swagger file>
+    python build.py [--no-cache] <path to swagger file>
+
+The loaded class descriptors are cached under ~/.cache/hikaru, keyed on the
+contents of both the swagger file and this program, so re-running the build
+on unchanged input skips parsing the swagger file altogether. If the swagger
+file has changed, the descriptors from the previous build are reused for any
+definitions whose contents haven't changed. Supply --no-cache to ignore and
+not write the cache.
 
 The assumption is to create the 'build' package in the cwd.
 
@@ -61,18 +68,40 @@ get args            __args__        typing.get_args()
 inspect.signature() can give the argument signature for a
 method; can find how many required positional args there are.
 """
+from collections import ChainMap, deque, namedtuple
+from functools import lru_cache
+from operator import attrgetter
+from io import BytesIO, StringIO
 from pathlib import Path
 import sys
-from typing import Union, List, Optional
-import json
-import networkx
+import hashlib
+import pickle
+import shutil
+import textwrap
+from typing import Union, List, Optional, Dict, Tuple
+try:
+    import orjson as _json
+except ImportError:  # pragma: no cover
+    import json as _json
+try:
+    import ijson
+except ImportError:  # pragma: no cover
+    ijson = None
 from hikaru.naming import process_swagger_name, full_swagger_name
-from hikaru.meta import HikaruBase, HikaruDocumentBase
+from hikaru.meta import HikaruBase, HikaruDocumentBase, slotted
 
 
+# the same $ref strings get processed over and over, so memoize the results
+_psn = lru_cache(maxsize=None)(process_swagger_name)
+_fsn = lru_cache(maxsize=None)(full_swagger_name)
+
 python_reserved = {"except", "continue", "from"}
 
 
+def python_name(name: str) -> str:
+    return f'{name}_' if name in python_reserved else name
+
+
 types_map = {"boolean": "bool",
              "integer": "int",
              "string": "str",
@@ -83,26 +112,25 @@ types_map = {"boolean": "bool",
 NoneType = type(None)
 
 
+# annotation fragments shared by every optional property
+_FIELD_LIST = " = field(default_factory=list)"
+_FIELD_DICT = " = field(default_factory=dict)"
+_NONE_DEFAULT = " = None"
+
+
 unversioned_module_name = "unversioned"
 
 
-def _clean_directory(dirpath: str, including_dirpath=False):
-    path = Path(dirpath)
-    for p in path.iterdir():
-        if p.is_file():
-            p.unlink()
-        elif p.is_dir():
-            _clean_directory(str(p), including_dirpath=True)
-            if including_dirpath:
-                p.rmdir()
+_by_name = attrgetter('name')
 
 
 _package_init_code = \
 """
 try:
     from .v1 import *
+    from .v1 import __all__
 except ImportError:
-    pass"""
+    __all__ = []"""
 
 
 def prep_package(directory: str):
@@ -119,14 +147,16 @@ def prep_package(directory: str):
             path.unlink()
             path.mkdir(parents=True)
     # once here, the directory exists and is a directory; clean it out
-    _clean_directory(str(path))
+    for p in path.iterdir():
+        if p.is_dir():
+            shutil.rmtree(p)
+        else:
+            p.unlink()
     init = path / "__init__.py"
-    init.touch()
-    f = init.open('w')
-    print(_module_docstring, file=f)
-    print(_package_init_code, file=f)
-    print(file=f)
-    output_footer(stream=f)
+    buf = StringIO()
+    print(_module_docstring, file=buf)
+    print(_package_init_code, file=buf)
+    init.write_text(buf.getvalue())
 
 
 _copyright_string = \
@@ -170,8 +200,9 @@ def output_boilerplate(stream=sys.stdout, other_imports=None):
     """
     print(_module_docstring, file=stream)
     print(file=stream)
-    print(f"from hikaru.meta import {HikaruBase.__name__}, {HikaruDocumentBase.__name__}",
-          file=stream)
+    print("from __future__ import annotations", file=stream)
+    print(f"from hikaru.meta import {HikaruBase.__name__}, {HikaruDocumentBase.__name__},"
+          f" {slotted.__name__}", file=stream)
     print("from typing import Optional, List, Dict", file=stream)
     print("from dataclasses import dataclass, field", file=stream)
     if other_imports is not None:
@@ -181,87 +212,312 @@ def output_boilerplate(stream=sys.stdout, other_imports=None):
     print(file=stream)
 
 
-_module_footer = '''globs = dict(globals())
-__all__ = [c.__name__ for c in globs.values()
-           if type(c) == type]
-del globs'''
-
-
-def output_footer(stream=sys.stdout):
+def output_footer(stream=sys.stdout, names: List[str] = None):
     """
     Write out the footer that defines '__all__'
     :param stream: file to write the footer to
+    :param names: list of the names the module exports; duplicates are dropped
     """
-    print(_module_footer, file=stream)
+    names = dict.fromkeys(names or [])
+    print("__all__ = [", file=stream)
+    for line in textwrap.wrap(", ".join(repr(n) for n in names), width=88,
+                              initial_indent="    ", subsequent_indent="    ",
+                              break_long_words=False, break_on_hyphens=False):
+        print(line, file=stream)
+    print("]", file=stream)
+
+
+def build_digraph(all_classes: dict) -> Tuple[Dict["ClassDescriptor",
+                                                   List["ClassDescriptor"]],
+                                              Dict["ClassDescriptor", int]]:
+    """
+    Builds the dependency graph of the supplied classes
 
+    Any class that is depended upon but isn't in all_classes is still added
+    to the graph as a node.
 
-def build_digraph(all_classes: dict) -> networkx.DiGraph:
-    dg = networkx.DiGraph()
+    :param all_classes: dict of ClassDescriptors keyed by short name
+    :return: tuple of two dicts keyed by ClassDescriptor; the first maps each
+        class to the list of classes it depends on, the second maps each class
+        to the number of classes that depend upon it.
+    """
+    adj = {}
+    indeg = {}
     for cd in all_classes.values():
         assert isinstance(cd, ClassDescriptor)
         deps = cd.depends_on(include_external=True)
-        dg.add_node(cd)
+        adj.setdefault(cd, [])
+        indeg.setdefault(cd, 0)
         for c in deps:
-            dg.add_edge(cd, c)
+            adj[cd].append(c)
+            adj.setdefault(c, [])
+            indeg[c] = indeg.get(c, 0) + 1
+
+    return adj, indeg
+
 
-    return dg
+def topo_reverse(adj: dict, indeg: dict) -> list:
+    """
+    Returns the nodes of a graph from build_digraph() dependencies-first
+
+    This is Kahn's algorithm; the result is reversed so that every class
+    comes after all of the classes it depends upon. NOTE: indeg is consumed
+    by this function.
+
+    :param adj: dict mapping each node to a list of the nodes it depends on
+    :param indeg: dict mapping each node to the count of nodes depending on it
+    :return: list of all nodes in adj in reverse topological order
+    :raises RuntimeError: if the graph contains a cycle
+    """
+    q = deque([n for n, d in indeg.items() if d == 0])
+    out = []
+    while q:
+        n = q.popleft()
+        out.append(n)
+        for m in adj[n]:
+            indeg[m] -= 1
+            if indeg[m] == 0:
+                q.append(m)
+    if len(out) != len(adj):
+        raise RuntimeError("Dependency cycle found between classes; can't order them")
+    out.reverse()
+    return out
 
 
 def write_classes(class_list, stream=sys.stdout):
     for dc in class_list:
-        print(dc.as_python_class(), file=stream)
+        stream.writelines(dc.as_python_class_lines())
+
+
+_cache_dir = Path.home() / ".cache" / "hikaru"
+_last_build_file = _cache_dir / "last-build.pickle"
+
+
+def _build_digest() -> bytes:
+    # the descriptors are made by this file and by hikaru.naming, so no pickled
+    # descriptors from a different version of either can be trusted
+    h = hashlib.blake2b(digest_size=16)
+    for source in (__file__, sys.modules[process_swagger_name.__module__].__file__):
+        h.update(Path(source).read_bytes())
+    return h.digest()
+
+
+def _cache_path(swagger_data: bytes) -> Path:
+    h = hashlib.blake2b(swagger_data, digest_size=16)
+    h.update(_build_digest())
+    return _cache_dir / f"swagger-{h.hexdigest()}.pickle"
 
 
-def load_stable(swagger_file_path: str) -> NoneType:
-    f = open(swagger_file_path, 'r')
-    d = json.load(f)
-    for k, v in d["definitions"].items():
+def _definition_digest(d: dict) -> str:
+    if hasattr(_json, "OPT_SORT_KEYS"):  # orjson
+        data = _json.dumps(d, option=_json.OPT_SORT_KEYS)
+    else:
+        data = _json.dumps(d, sort_keys=True).encode()
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def _load_pickle(path: Path):
+    # returns the unpickled contents of path, or None if it's missing or can't
+    # be unpickled; a bad cache file is only ever a cache miss
+    try:
+        with path.open('rb') as f:
+            return pickle.load(f)
+    except Exception:
+        return None
+
+
+def _valid_module_defs(module_defs) -> bool:
+    # pickled descriptors are only usable if they are instances of this
+    # module's classes (and not, say, the same classes defined under __main__)
+    return (isinstance(module_defs, dict) and
+            all(isinstance(md, ModuleDef) and
+                all(isinstance(cd, ClassDescriptor) for cd in md.all_classes.values())
+                for md in module_defs.values()))
+
+
+def _swagger_definitions(swagger_data: bytes):
+    # yields (key, definition) pairs; if ijson is available, the definitions
+    # are streamed one at a time rather than materializing the whole document
+    if ijson is not None:
+        return ijson.kvitems(BytesIO(swagger_data), 'definitions', use_float=True)
+    return _json.loads(swagger_data)["definitions"].items()
+
+
+def _load_last_build() -> dict:
+    # loads the module defs from the previous build and returns its manifest
+    # of definition digests; returns an empty manifest if there's nothing usable
+    last_build = _load_pickle(_last_build_file)
+    if not (isinstance(last_build, tuple) and len(last_build) == 3):
+        return {}
+    build_digest, manifest, module_defs = last_build
+    if (build_digest != _build_digest() or not isinstance(manifest, dict) or
+            not _valid_module_defs(module_defs)):
+        return {}
+    _all_module_defs.update(module_defs)
+    return manifest
+
+
+def _process_definitions(definitions, previous: dict, digests: bool = True) -> dict:
+    # builds or updates the class descriptors for the swagger definitions,
+    # skipping any whose digest matches the previous build's. Returns the
+    # manifest of digests for these definitions; if digests is False, none
+    # are computed and the manifest's values are all None.
+    manifest = {}
+    processed = set()
+    for k, v in definitions:
         if 'apiextensions' not in k:
-            group, version, name = process_swagger_name(k)
+            digest = manifest[k] = _definition_digest(v) if digests else None
+            group, version, name = _psn(k)
             mod_def = get_module_def(version)
             cd = mod_def.get_class_desc(name)
+            if (cd is not None and digest is not None and previous.get(k) == digest and
+                    cd not in processed):
+                continue
+            # several definitions can share a descriptor, the last one winning;
+            # once one is re-processed, all the following ones must be too
             if cd is None:
                 cd = ClassDescriptor(k, v)
                 mod_def.save_class_desc(cd)
             else:
                 cd.update(v)
             cd.process_properties()
+            processed.add(cd)
+    return manifest
+
+
+def _resolve_refs():
+    # looks up the classes for all properties' $refs now that all definitions
+    # are loaded, so that any placeholders exist before the module defs are
+    # pickled or handed to other processes
+    for md in list(_all_module_defs.values()):
+        for cd in list(md.all_classes.values()):
+            for p in cd.required_props:
+                p.depends_on()
+            for p in cd.optional_props:
+                p.depends_on()
+
+
+def _prune_stale_classes(manifest: dict):
+    # drops classes left over from the previous build that are no longer
+    # defined or referenced by anything, and any module left empty
+    referenced = set()
+    for md in _all_module_defs.values():
+        for cd in md.all_classes.values():
+            referenced.update(cd.depends_on(include_external=True))
+    for version, md in list(_all_module_defs.items()):
+        for name, cd in list(md.all_classes.items()):
+            if cd.full_name not in manifest and cd not in referenced:
+                del md.all_classes[name]
+        if not md.all_classes:
+            del _all_module_defs[version]
+
+
+def load_stable(swagger_file_path: str, use_cache: bool = True) -> NoneType:
+    """
+    Loads the class descriptors from the swagger file into the module defs
+
+    :param swagger_file_path: string; path to the swagger file to process
+    :param use_cache: bool, default True. If True, a previously pickled set of
+        module defs for the same swagger file is used if present. Otherwise the
+        module defs from the previous build are the starting point, and only
+        the definitions that have changed since then are processed. The newly
+        loaded module defs are pickled for subsequent runs.
+    """
+    data = Path(swagger_file_path).read_bytes()
+    cache_file = _cache_path(data) if use_cache else None
+    if cache_file is not None:
+        cached = _load_pickle(cache_file)
+        if _valid_module_defs(cached):
+            _all_module_defs.update(cached)
+            return
+    previous = _load_last_build() if use_cache else {}
+    manifest = _process_definitions(_swagger_definitions(data), previous,
+                                    digests=use_cache)
+    if previous and previous.keys() - manifest.keys():
+        # definitions were removed; there's no telling what depended on
+        # them, so start over from scratch
+        _all_module_defs.clear()
+        manifest = _process_definitions(_swagger_definitions(data), {})
+        previous = {}
+    _resolve_refs()
+    if previous:
+        _prune_stale_classes(manifest)
+    if cache_file is not None:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with cache_file.open('wb') as f:
+            pickle.dump(_all_module_defs, f, protocol=pickle.HIGHEST_PROTOCOL)
+        with _last_build_file.open('wb') as f:
+            pickle.dump((_build_digest(), manifest, _all_module_defs), f,
+                        protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def render_module(md: "ModuleDef", ext_mds: List["ModuleDef"],
+                  order: List["ClassDescriptor"] = None) -> str:
+    """
+    Returns the source of the Python module for the supplied module def
+
+    This only depends on its arguments; it doesn't write anything itself.
+
+    :param md: the ModuleDef to render
+    :param ext_mds: list of the ModuleDefs for the other versions md uses, as
+        returned by md.external_module_defs()
+    :param order: optional list of ClassDescriptors for every module, ordered
+        dependencies-first; if supplied, the module's classes are written in
+        this order rather than sorting them again.
+    :return: string containing the full text of the module
+    """
+    buf = StringIO()
+    md.as_python_module(stream=buf, ext_mds=ext_mds, order=order)
+    return buf.getvalue()
 
 
 def write_modules(pkgpath: str):
     pkg = Path(pkgpath)
     d = module_defs()
     mod_names = []
+    paths = []
+    mds = []
     base = d.get(None)
-    # first, create the module with un-versioned object defs
+    # first, the module with un-versioned object defs
     if base:
-        unversioned = pkg / f'{unversioned_module_name}.py'
         assert isinstance(base, ModuleDef)
-        f = unversioned.open('w')
-        base.as_python_module(stream=f)
-        f.close()
+        paths.append(pkg / f'{unversioned_module_name}.py')
+        mds.append(base)
 
-    # next, write out all the version-specific object defs
+    # next, all the version-specific object defs
     for k, md in d.items():
         if k is not None:
             assert isinstance(md, ModuleDef)
             mod_names.append(md.version)
-            mod = pkg / f'{md.version}.py'
-            f = mod.open('w')
-            md.as_python_module(stream=f)
-            f.close()
+            paths.append(pkg / f'{md.version}.py')
+            mds.append(md)
+
+    # sort the classes of all versions together just once; each module then
+    # writes its own classes in this order
+    global_classes = {(md.version, cd.short_name): cd
+                      for md in mds for cd in md.all_classes.values()}
+    order = topo_reverse(*build_digraph(global_classes))
+
+    # rendering takes only milliseconds per module, far less than it would
+    # cost to ship the descriptors to worker processes, so do it in-process
+    for path, md in zip(paths, mds):
+        path.write_text(render_module(md, md.external_module_defs(), order=order))
 
     # finally, capture the names of all the version modules in version module
     versions = pkg / 'versions.py'
-    f = versions.open('w')
-    print(f"versions = {str(mod_names)}", file=f)
-    f.close()
+    versions.write_text(f"versions = {str(mod_names)}\n")
 
 
 class ClassDescriptor(object):
+    __slots__ = ('full_name', 'short_name', 'group', 'version', 'description',
+                 'all_properties', 'required', 'type', 'is_subclass_of',
+                 'is_document', 'required_props', 'optional_props',
+                 'optional_scalar_props', 'optional_container_props',
+                 '_deps_ext', '_deps_int')
+
     def __init__(self, key, d):
-        self.full_name = full_swagger_name(key)
-        group, version, name = process_swagger_name(self.full_name)
+        self.full_name = _fsn(key)
+        group, version, name = _psn(self.full_name)
         self.short_name = name
         self.group = group
         self.version = version
@@ -274,21 +530,27 @@ class ClassDescriptor(object):
 
         self.required_props = []
         self.optional_props = []
+        self.optional_scalar_props = []
+        self.optional_container_props = []
+        self._deps_ext = self._deps_int = None
         self.update(d)
 
     def update(self, d: dict):
+        self._deps_ext = self._deps_int = None
         self.description = d.get("description")
         self.all_properties = d.get("properties", {})
         self.required = d.get("required", [])
         self.type = d.get('type', None)
-        if self.type in types_map:
-            self.is_subclass_of = types_map[self.type]
+        # descriptors are reused across builds, so this must be reset each time
+        self.is_subclass_of = types_map.get(self.type)
 
     _doc_markers = ("apiVersion", "kind", "metadata")
 
     def process_properties(self):
         self.required_props = []
         self.optional_props = []
+        self._deps_ext = self._deps_int = None
+        self.is_document = False
         seen_markers = set(self._doc_markers)
         if self.is_subclass_of is None:  # then there are properties
             for k, v in self.all_properties.items():
@@ -296,33 +558,82 @@ class ClassDescriptor(object):
                     seen_markers.remove(k)
                     if not seen_markers:
                         self.is_document = True
-                fd = PropertyDescriptor(self, k, v)
+                if v.get("type") in types_map:
+                    # plain scalars don't need a full descriptor
+                    fd = ScalarProp(python_name(k), v.get('description', ""),
+                                    types_map[v["type"]])
+                else:
+                    fd = PropertyDescriptor(self, k, v)
                 if k in self.required:
                     self.required_props.append(fd)
                 else:
                     self.optional_props.append(fd)
-            self.required_props.sort(key=lambda x: x.name)
-            self.optional_props.sort(key=lambda x: x.name)
+            self.required_props.sort(key=_by_name)
+            self.optional_props.sort(key=_by_name)
+        # optional props are written scalars first, then containers
+        self.optional_scalar_props = [p for p in self.optional_props
+                                      if p.container_type is None]
+        self.optional_container_props = [p for p in self.optional_props
+                                         if p.container_type is not None]
+
+    @staticmethod
+    def line_breaks(word_lens: List[int], first_indent: int, next_indent: int,
+                    width: int = 90) -> List[int]:
+        """
+        Greedily fills lines with words; returns where each new line starts
+
+        :param word_lens: list of the lengths of the words, in order
+        :param first_indent: length of the indent on the first line
+        :param next_indent: length of the indent on any following lines
+        :param width: maximum line length; a word that won't fit on a line by
+            itself gets a line of its own anyway
+        :return: list of the indices of the words that start the second and
+            subsequent lines
+        """
+        breaks = []
+        if word_lens:
+            cur = first_indent + word_lens[0]
+            for i in range(1, len(word_lens)):
+                n = word_lens[i]
+                if cur + 1 + n > width:
+                    breaks.append(i)
+                    cur = next_indent + n
+                else:
+                    cur += 1 + n
+        return breaks
 
     @staticmethod
     def split_line(line, prefix: str = "   ", hanging_indent: str = "") -> List[str]:
+        if line is None:
+            return []
+        words = line.split()
+        if not words:
+            return [prefix]
+        # words are separated by single spaces, including from the prefix and
+        # the hanging indent
+        first_indent = f"{prefix} "
+        next_indent = (f"{first_indent}{hanging_indent} "
+                       if hanging_indent else
+                       first_indent)
+        breaks = ClassDescriptor.line_breaks([len(w) for w in words],
+                                             len(first_indent), len(next_indent))
         parts = []
-        if line is not None:
-            words = line.split()
-            current_line = [prefix]
-            for w in words:
-                if sum(len(s) for s in current_line) + len(current_line) + len(w) > 90:
-                    parts.append(" ".join(current_line))
-                    current_line = [prefix]
-                    if hanging_indent:
-                        current_line.append(hanging_indent)
-                current_line.append(w)
-            else:
-                if current_line:
-                    parts.append(" ".join(current_line))
+        indent = first_indent
+        start = 0
+        for end in breaks:
+            parts.append(indent + " ".join(words[start:end]))
+            indent = next_indent
+            start = end
+        parts.append(indent + " ".join(words[start:]))
         return parts
 
-    def as_python_class(self) -> str:
+    def _docstring_lines(self, line, hanging_indent: str = "") -> List[str]:
+        return [f"{s}\n" for s in self.split_line(line, hanging_indent=hanging_indent)]
+
+    def as_python_class_lines(self) -> List[str]:
+        """
+        Returns the source of the class as a list of newline-terminated lines
+        """
         lines = list()
         # start of class statement
         if self.is_subclass_of is not None:
@@ -332,56 +643,71 @@ class ClassDescriptor(object):
             base = (HikaruDocumentBase.__name__
                     if self.is_document else
                     HikaruBase.__name__)
-            lines.append("@dataclass")
-        lines.append(f"class {self.short_name}({base}):")
+            lines.append(f"@{slotted.__name__}\n")
+            lines.append("@dataclass\n")
+        lines.append(f"class {self.short_name}({base}):\n")
         # now the docstring
-        ds_parts = ['    """']
-        ds_parts.extend(self.split_line(self.description))
-        ds_parts.append("")
-        ds_parts.append(f'    Full name: {self.full_name.split("/")[-1]}')
+        lines.append('    """\n')
+        lines.extend(self._docstring_lines(self.description))
+        lines.append("\n")
+        lines.append(f'    Full name: {self.full_name.split("/")[-1]}\n')
         if self.is_subclass_of is None:
-            ds_parts.append("")
-            ds_parts.append("    Attributes:")
+            lines.append("\n")
+            lines.append("    Attributes:\n")
             for p in self.required_props:
-                ds_parts.extend(self.split_line(f'{p.name}: {p.description}',
-                                                hanging_indent="   "))
-            for p in (x for x in self.optional_props if x.container_type is None):
-                ds_parts.extend(self.split_line(f'{p.name}: {p.description}',
-                                                hanging_indent="   "))
-            for p in (x for x in self.optional_props if x.container_type is not None):
-                ds_parts.extend(self.split_line(f'{p.name}: {p.description}',
-                                                hanging_indent="   "))
-        ds_parts.append('    """')
-        lines.extend(ds_parts)
+                lines.extend(self._docstring_lines(f'{p.name}: {p.description}',
+                                                   hanging_indent="   "))
+            for p in self.optional_scalar_props:
+                lines.extend(self._docstring_lines(f'{p.name}: {p.description}',
+                                                   hanging_indent="   "))
+            for p in self.optional_container_props:
+                lines.extend(self._docstring_lines(f'{p.name}: {p.description}',
+                                                   hanging_indent="   "))
+        lines.append('    """\n')
         if self.is_subclass_of is None:
             if self.required_props or self.optional_props:
-                lines.append("")
+                lines.append("\n")
             if self.is_document:
-                lines.append(f"    _version = '{self.version}'")
+                lines.append(f"    _version = '{self.version}'\n")
             for p in self.required_props:
-                lines.append(p.as_python_typeanno(True))
-            for p in (x for x in self.optional_props if x.container_type is None):
-                lines.append(p.as_python_typeanno(False))
-            for p in (x for x in self.optional_props if x.container_type is not None):
-                lines.append(p.as_python_typeanno(False))
-        lines.append("")
-        lines.append("")
+                lines.append(f"{p.as_python_typeanno(True)}\n")
+            for p in self.optional_scalar_props:
+                lines.append(f"{p.as_python_typeanno(False)}\n")
+            for p in self.optional_container_props:
+                lines.append(f"{p.as_python_typeanno(False)}\n")
+        lines.append("\n")
+        lines.append("\n")
 
-        return "\n".join(lines)
+        return lines
+
+    def as_python_class(self) -> str:
+        return "".join(self.as_python_class_lines())
 
     def depends_on(self, include_external=False) -> list:
-        r = [p.depends_on() for p in self.required_props]
-        deps = [p for p in r
-                if p is not None]
-        o = [p.depends_on() for p in self.optional_props]
-        deps.extend(p for p in o
-                    if p is not None and (True
-                                          if include_external else
-                                          self.version == p.version))
-        return deps
+        if self._deps_ext is None:
+            # compute both flavours in one pass and keep them until the
+            # properties change
+            deps_ext = []
+            deps_int = []
+            for p in self.required_props:
+                dep = p.depends_on()
+                if dep is not None:
+                    deps_ext.append(dep)
+                    deps_int.append(dep)
+            for p in self.optional_props:
+                dep = p.depends_on()
+                if dep is not None:
+                    deps_ext.append(dep)
+                    if self.version == dep.version:
+                        deps_int.append(dep)
+            self._deps_ext = deps_ext
+            self._deps_int = deps_int
+        return self._deps_ext if include_external else self._deps_int
 
 
 class ModuleDef(object):
+    __slots__ = ('version', 'all_classes')
+
     def __init__(self, version):
         self.version = version
         self.all_classes = {}
@@ -402,26 +728,47 @@ class ModuleDef(object):
                     ext_ver.add(dep.version)
         return list(ext_ver)
 
-    def as_python_module(self, stream=sys.stdout):
+    def external_module_defs(self) -> List["ModuleDef"]:
+        # the unversioned module, if used, comes first
         externals = self.external_versions_used()
+        externals.sort(key=lambda v: (v is not None, v or ""))
+        return [_all_module_defs[ext] for ext in externals]
+
+    def as_python_module(self, stream=sys.stdout, ext_mds: List["ModuleDef"] = None,
+                         order: List[ClassDescriptor] = None):
+        if ext_mds is None:
+            ext_mds = self.external_module_defs()
         other_imports = []
-        if None in externals:
-            other_imports.append(f'from .{unversioned_module_name} import *')
-            externals.remove(None)
-        externals.sort()
-        all_classes = {}
-        for ext in externals:
-            emod = _all_module_defs[ext]
+        # names the module exports besides its own classes
+        names = [HikaruBase.__name__, HikaruDocumentBase.__name__]
+        ext_classes = []
+        for emod in ext_mds:
             assert isinstance(emod, ModuleDef)
-            all_classes.update(emod.all_classes)
-        all_classes.update(self.all_classes)
-        g = build_digraph(all_classes)
+            if emod.version is None:
+                # star-imported rather than written into this module
+                other_imports.append(f'from .{unversioned_module_name} import *')
+                names.extend(emod.all_classes)
+            else:
+                ext_classes.append(emod.all_classes)
+        # a read-only view over the class dicts; earlier maps win lookups, so
+        # this module's own classes come first and later externals shadow
+        # earlier ones
+        all_classes = ChainMap(self.all_classes, *reversed(ext_classes))
         output_boilerplate(stream=stream, other_imports=other_imports)
-        traversal = list(reversed(list(networkx.topological_sort(g))))
+        if order is None:
+            traversal = topo_reverse(*build_digraph(all_classes))
+        else:
+            # the module holds the same classes its own graph would have;
+            # those in all_classes plus anything they directly depend upon
+            members = set(all_classes.values())
+            for cd in all_classes.values():
+                members.update(cd.depends_on(include_external=True))
+            traversal = [cd for cd in order if cd in members]
         if not traversal:
             traversal = list(self.all_classes.values())
         write_classes(traversal, stream=stream)
-        output_footer(stream=stream)
+        names.extend(cd.short_name for cd in traversal)
+        output_footer(stream=stream, names=names)
 
 
 _all_module_defs = {}
@@ -438,18 +785,43 @@ def module_defs() -> dict:
     return dict(_all_module_defs)
 
 
+def class_desc_for_ref(ref: str) -> ClassDescriptor:
+    """
+    Returns the ClassDescriptor named by a $ref, making an empty one if needed
+
+    :param ref: string; the value of a $ref in the swagger file
+    :return: the ClassDescriptor for the ref. If no definition for it has
+        been loaded, an empty placeholder is created and saved.
+    """
+    group, version, short_name = _psn(ref)
+    mod_def = get_module_def(version)
+    cd = mod_def.get_class_desc(short_name)
+    if cd is None:
+        cd = ClassDescriptor(_fsn(ref), {})  # make a placeholder
+        mod_def.save_class_desc(cd)
+    return cd
+
+
 class PropertyDescriptor(object):
+    __slots__ = ('name', 'containing_class', 'description', 'container_type',
+                 'item_type', 'prop_type', '_pending_ref')
+
     def __init__(self, containing_class, name, d):
         """
         capture the information
+
+        Any $ref isn't looked up until the property is first used, by which time
+        all definitions have been loaded.
+
         :param containing_class:
         :param d:
         """
-        self.name = f'{name}_' if name in python_reserved else name
+        self.name = python_name(name)
         self.containing_class = containing_class
         self.description = d.get('description', "")
         # all possible attributes that could be populated
         self.container_type = self.item_type = self.prop_type = None
+        self._pending_ref = None
         ctype = d.get("type")
         if ctype == "array":
             self.container_type = list
@@ -457,15 +829,7 @@ class PropertyDescriptor(object):
             self.item_type = items.get('type')
             if self.item_type is None:
                 # then it is a list of objects; possibly of one of the defs
-                ref = items["$ref"]  # should become get when we know this is true
-                group, version, short_name = process_swagger_name(ref)
-                fullname = full_swagger_name(ref)
-                mod_def = get_module_def(version)
-                item_ref = mod_def.get_class_desc(short_name)
-                if item_ref is None:
-                    item_ref = ClassDescriptor(fullname, {})  # make a placeholder
-                    mod_def.save_class_desc(item_ref)
-                self.item_type = item_ref
+                self._pending_ref = items["$ref"]  # should become get when we know this is true
             elif self.item_type in types_map:
                 self.item_type = types_map[self.item_type]
             else:
@@ -479,20 +843,23 @@ class PropertyDescriptor(object):
             if ctype in types_map:
                 self.prop_type = types_map[ctype]
             else:
-                group, version, short_name = process_swagger_name(d["$ref"])
-                fullname = full_swagger_name(d["$ref"])
-                mod_def = get_module_def(version)
-                ref_class = mod_def.get_class_desc(short_name)
-                if ref_class is None:
-                    ref_class = ClassDescriptor(fullname, {})
-                    mod_def.save_class_desc(ref_class)
+                self._pending_ref = d["$ref"]
+
+    def _resolve(self):
+        if self._pending_ref is not None:
+            ref_class = class_desc_for_ref(self._pending_ref)
+            if self.container_type is list:
+                self.item_type = ref_class
+            else:
                 self.prop_type = ref_class
+            self._pending_ref = None
 
     @staticmethod
     def as_required(anno: str, as_required: bool) -> str:
-        return anno if as_required else f"Optional[{anno}]"
+        return anno if as_required else sys.intern(f"Optional[{anno}]")
 
     def depends_on(self) -> Union[ClassDescriptor, NoneType]:
+        self._resolve()
         result = None
         if isinstance(self.item_type, ClassDescriptor):
             result = self.item_type
@@ -501,6 +868,7 @@ class PropertyDescriptor(object):
         return result
 
     def as_python_typeanno(self, as_required: bool) -> str:
+        self._resolve()
         parts = ["    ", self.name, ": "]
         if self.container_type is None:
             # then a straight-up type, either scalar or another object
@@ -527,31 +895,62 @@ class PropertyDescriptor(object):
             # supply this argument when creating it programmatically
             if self.container_type is not None:
                 # then we need a field
-                factory = "list" if self.container_type is list else "dict"
-                parts.append(f" = field(default_factory={factory})")
+                parts.append(_FIELD_LIST
+                             if self.container_type is list else
+                             _FIELD_DICT)
             else:
                 # just default it to None
-                parts.append(" = None")
-        return "".join(parts)
+                parts.append(_NONE_DEFAULT)
+        return sys.intern("".join(parts))
+
+
+class ScalarProp(namedtuple('ScalarProp', ['name', 'description', 'prop_type'])):
+    """
+    A property whose value is a plain scalar, such as a str or an int
+
+    This stands in for a PropertyDescriptor for the most common kind of
+    property, and so supports the same attributes and methods the rest of the
+    build uses.
+    """
+    __slots__ = ()
+    container_type = None
+    item_type = None
+
+    def depends_on(self) -> NoneType:
+        return None
+
+    def as_python_typeanno(self, as_required: bool) -> str:
+        anno = PropertyDescriptor.as_required(self.prop_type, as_required)
+        default = "" if as_required else _NONE_DEFAULT
+        return sys.intern(f"    {self.name}: {anno}{default}")
 
 
 model_package = "hikaru/model"
 
 
-def build_it(swagger_file: str):
+def build_it(swagger_file: str, use_cache: bool = True):
     """
     Initiate the swagger-file-driven model package build
 
     :param swagger_file: string; path to the swagger file to process
+    :param use_cache: bool, default True; if False, neither read nor write the
+        cache of loaded class descriptors
     """
-    load_stable(swagger_file)
+    load_stable(swagger_file, use_cache=use_cache)
+    if not _valid_module_defs(_all_module_defs):
+        raise RuntimeError("Internal error! The loaded class descriptors aren't"
+                           " usable; not touching the model package")
     prep_package(model_package)
     write_modules(model_package)
 
 
 if __name__ == "__main__":
-    if len(sys.argv) < 2:
-        print(f"usage: {sys.argv[0]} <path-to-swagger-json-file>")
+    # build through the 'build' module rather than '__main__' so that pickled
+    # descriptors name the same classes however the build was started
+    import build
+    args = [a for a in sys.argv[1:] if a != "--no-cache"]
+    if len(args) < 1:
+        print(f"usage: {sys.argv[0]} [--no-cache] <path-to-swagger-json-file>")
         sys.exit(1)
-    build_it(sys.argv[1])
+    build.build_it(args[0], use_cache="--no-cache" not in sys.argv[1:])
     sys.exit(0)
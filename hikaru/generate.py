@@ -27,6 +27,11 @@ from autopep8 import fix_code
 from black import format_file_contents, FileMode
 from ruamel.yaml import YAML
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from hikaru.model import *
 from hikaru.meta import HikaruBase
 from hikaru.naming import process_api_version
@@ -150,6 +155,13 @@ def get_json(obj: HikaruBase) -> str:
         function is must useful for storing a model's representation in a
         document database.
 
+    The JSON is compact, without whitespace between tokens. If the orjson package
+    is installed it is used to do the encoding, as it is considerably faster;
+    anything orjson can't encode (such as ints beyond 64 bits) falls back to the
+    standard json module. The two encoders don't format every value the same
+    way (floats and NaN, for instance), so the text may differ slightly
+    depending on which was used, but it loads back to the same model.
+
     :param obj: instance of a HikaruBase model
     :return: string containing JSON that represents the information in the model
     :raises TypeError: if obj is not an instance of a HikaruBase subclass
@@ -157,7 +169,13 @@ def get_json(obj: HikaruBase) -> str:
     if not isinstance(obj, HikaruBase):
         raise TypeError("obj must be an instance of a HikaruBase subclass")
     d = get_clean_dict(obj)
-    s = json.dumps(d)
+    if orjson is not None:
+        try:
+            # YAML mappings can have int or bool keys; json renders those as strings
+            return orjson.dumps(d, option=orjson.OPT_NON_STR_KEYS).decode()
+        except orjson.JSONEncodeError:
+            pass
+    s = json.dumps(d, separators=(",", ":"), ensure_ascii=False)
     return s
 
 
@@ -259,14 +277,14 @@ def get_processors(path: str = None, stream: TextIO = None,
     if path is None and stream is None and yaml is None:
         raise RuntimeError("One of path, stream, or yaml must be specified")
     objs = []
-    if path:
-        f = open(path, "r")
-    if stream:
-        f = stream
     if yaml:
         to_parse = yaml
+    elif stream:
+        to_parse = stream.read()
     else:
-        to_parse = f.read()
+        with open(path, "r") as f:
+            to_parse = f.read()
+    # the 'safe' loader uses libyaml's C parser when ruamel.yaml.clib is present
     parser = YAML(typ="safe")
     docs = list(parser.load_all(to_parse))
     return docs
@@ -27,11 +27,14 @@ class provides all of the machinery for working with the both Python and YAML:
 it can do the YAML parsing, the Python generation, and the Python runtime
 object management.
 """
+import sys
 from enum import Enum
-from typing import Union, List, Dict, Type, Any
+from typing import Union, List, Dict, Type, Any, get_type_hints
 from dataclasses import fields, dataclass, is_dataclass
 from inspect import signature, Parameter
 from collections import defaultdict, namedtuple
+from functools import lru_cache
+from operator import attrgetter, itemgetter
 
 try:
     from typing import get_args, get_origin
@@ -48,6 +51,107 @@ NoneType = type(None)
 _not_there = object()
 
 
+_field_types_cache: Dict[type, Dict[str, Any]] = {}
+
+
+def _field_types(cls) -> Dict[str, Any]:
+    # the generated model modules postpone the evaluation of annotations, so
+    # the 'type' of each dataclass field is a string; resolve them all once
+    # per class and hand back the real types keyed by field name
+    try:
+        return _field_types_cache[cls]
+    except KeyError:
+        types = _field_types_cache[cls] = get_type_hints(cls)
+        return types
+
+
+_TypeSchemaEntry = namedtuple('_TypeSchemaEntry', ['name', 'is_required', 'initial_type',
+                                                   'attr_type', 'contained_type'])
+
+
+_type_schema_cache: Dict[type, tuple] = {}
+
+
+def _type_schema(cls) -> tuple:
+    # what get_type_warnings() checks each field of cls against, worked out
+    # from the field annotations once per class
+    schema = _type_schema_cache.get(cls)
+    if schema is not None:
+        return schema
+    field_types = _field_types(cls)
+    entries = []
+    for f in fields(cls):
+        is_required = True
+        initial_type = field_types[f.name]
+        origin = get_origin(initial_type)
+        if origin is Union:  # this is optional; grab what's inside
+            type_args = get_args(initial_type)
+            if NoneType in type_args:
+                is_required = False
+                initial_type = type_args[0]
+            else:
+                raise NotImplementedError("Internal error! We aren't expecting this "
+                                          "case. Please file a bug report.")
+        # current value of initial_type:
+        # ok, now we have either a scaler (int, bool, str, etc),
+        # a subclass of HikaruBase,
+        # or a container (Dict, List)
+        # now we want the attr's real type (scalars, dict, list, HikaruBase)
+        # and if list, we want the contained type
+        contained_type = None
+        attr_type = initial_type
+        origin = get_origin(initial_type)
+        if origin is list:
+            attr_type = list
+            contained_type = get_args(initial_type)[0]
+        elif origin is dict:
+            attr_type = dict
+        elif (type(initial_type) != type or
+                not issubclass(initial_type, (str, int,  float,
+                                              bool, HikaruBase))):
+            raise NotImplementedError(f"Internal error! Some other kind of type:"
+                                      f" {initial_type}, name={f.name}."
+                                      f" Please file a bug report.")
+        entries.append(_TypeSchemaEntry(f.name, is_required, initial_type, attr_type,
+                                        contained_type))
+    schema = _type_schema_cache[cls] = tuple(entries)
+    return schema
+
+
+def _signpost(sp):
+    # list indexes may arrive as strings; anything that isn't an int or a str
+    # can't be on a path
+    try:
+        return int(sp)
+    except (ValueError, TypeError) as e:
+        if not isinstance(sp, str):
+            raise ValueError(str(e))
+        return sp
+
+
+@lru_cache(maxsize=1024)
+def _parse_following(following: str) -> tuple:
+    return tuple(_signpost(sp) for sp in following.split('.'))
+
+
+# str fields whose values come from small, fixed sets defined by Kubernetes;
+# process() interns these values so all objects share a single copy of each
+_enum_fields = frozenset({
+    'concurrencyPolicy', 'dnsPolicy', 'effect', 'externalTrafficPolicy',
+    'fsGroupChangePolicy', 'imagePullPolicy', 'ipFamilyPolicy', 'mountPropagation',
+    'operator', 'persistentVolumeReclaimPolicy', 'phase', 'podManagementPolicy',
+    'preemptionPolicy', 'procMount', 'protocol', 'reclaimPolicy', 'restartPolicy',
+    'scheme', 'sessionAffinity', 'terminationMessagePolicy', 'volumeMode',
+    'whenUnsatisfiable',
+})
+
+
+# getter chains for paths object_at_path() has already walked successfully,
+# keyed by (class, path tuple)
+_path_getters: Dict[tuple, tuple] = {}
+_max_path_getters = 1024
+
+
 CatalogEntry = namedtuple('CatalogEntry', ['cls', 'attrname', 'path'])
 
 TypeWarning = namedtuple('TypeWarning', ['cls', 'attrname', 'path', 'warning'])
@@ -72,8 +176,45 @@ class DiffDetail:
     other_value: Any = None
 
 
+def slotted(cls):
+    """
+    Class decorator that rebuilds a dataclass to keep its fields in __slots__
+
+    This does what dataclass(slots=True) does in Python 3.10 and later, and must
+    be applied above @dataclass. Instances of the resulting class have no
+    per-instance __dict__, which makes the large numbers of small objects in a
+    model a good deal smaller. This only pays off if every class in the
+    hierarchy has __slots__, which is why HikaruBase and HikaruDocumentBase
+    declare them.
+
+    :param cls: a dataclass
+    :return: a new class with the same name, bases and contents as cls, with
+        slots for each field not already given one by a base class
+    """
+    cls_dict = dict(cls.__dict__)
+    field_names = [f.name for f in fields(cls)]
+    inherited = set()
+    for base in cls.__mro__[1:]:
+        inherited.update(base.__dict__.get('__slots__', ()))
+    cls_dict['__slots__'] = tuple(name for name in field_names
+                                  if name not in inherited)
+    # field defaults are already captured by __init__, and a class attribute
+    # of the same name as a slot isn't allowed
+    for name in field_names:
+        cls_dict.pop(name, None)
+    cls_dict.pop('__dict__', None)
+    cls_dict.pop('__weakref__', None)
+    qualname = getattr(cls, '__qualname__', None)
+    cls = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+    if qualname is not None:
+        cls.__qualname__ = qualname
+    return cls
+
+
 @dataclass
 class HikaruBase(object):
+    __slots__ = ('_type_catalog', '_field_catalog', '__weakref__')
+
     def __post_init__(self):
         self._type_catalog = defaultdict(list)
         self._field_catalog = defaultdict(list)
@@ -115,12 +256,14 @@ class HikaruBase(object):
                                         idx, name)
 
     def _capture_catalog(self):
+        field_types = _field_types(self.__class__)
         for f in fields(self):
-            initial_type = get_origin(f.type)
+            ftype = field_types[f.name]
+            initial_type = get_origin(ftype)
             if initial_type is Union:
-                assignment_type = get_args(f.type)[0]
+                assignment_type = get_args(ftype)[0]
             else:
-                assignment_type = f.type
+                assignment_type = ftype
             del initial_type
             # now we have the type without a Union
             obj = getattr(self, f.name, None)
@@ -275,21 +418,17 @@ class HikaruBase(object):
             result.extend(field_list)
 
         if following:
+            # normalise the signposts once rather than for every candidate
             if isinstance(following, str):
-                signposts = following.split('.')
-            elif isinstance(following, (list, tuple)):
-                signposts = following
+                signposts = _parse_following(following)
+            else:
+                signposts = [_signpost(sp) for sp in following]
             candidates = result
             result = []
             for ce in candidates:
                 assert isinstance(ce, CatalogEntry)
                 start = 0
                 for sp in signposts:
-                    try:
-                        sp = int(sp)
-                    except (ValueError, TypeError) as e:
-                        if not isinstance(sp, str):
-                            raise ValueError(str(e))
                     try:
                         start = ce.path.index(sp, start)
                     except ValueError:
@@ -322,7 +461,26 @@ class HikaruBase(object):
         :raises AttributeError: raised if any attribute on the path isn't an
             attribute of the previous object on the path
         """
+        try:
+            key = (self.__class__, tuple(path))
+            getters = _path_getters.get(key)
+        except TypeError:  # unhashable path elements; just walk it
+            key = getters = None
+        if getters is not None:
+            # this path has been walked before; replay it, falling back to the
+            # checked walk below to sort out anything unexpected
+            obj = self
+            try:
+                for g in getters:
+                    obj = g(obj)
+            except (AttributeError, IndexError, KeyError, TypeError):
+                pass
+            else:
+                if obj is not None:
+                    return obj
+
         obj = self
+        getters = []
         for p in path:
             if isinstance(obj, (list, tuple)):
                 try:
@@ -338,6 +496,7 @@ class HikaruBase(object):
                     else:
                         if obj is None:
                             raise RuntimeError(f"Path {path} leads to None at {p}")
+                    getters.append(itemgetter(idx_p))
             else:
                 try:
                     obj = getattr(obj, p, _not_there)
@@ -346,6 +505,11 @@ class HikaruBase(object):
                 else:
                     if obj is _not_there:
                         raise AttributeError(f"Path {path} leads to an unknown attr at {p}")
+                getters.append(attrgetter(p))
+        if key is not None:
+            if len(_path_getters) >= _max_path_getters:
+                _path_getters.clear()
+            _path_getters[key] = tuple(getters)
         return obj
 
     @classmethod
@@ -382,17 +546,16 @@ class HikaruBase(object):
         :return: and instance of 'cls' with all scalar attrs set to None and
             all collection attrs set to an appropriate empty collection
         """
-        field_map = {f.name: f for f in fields(cls)}
+        field_types = _field_types(cls)
         kw_args = {}
         sig = signature(cls.__init__)
         for p in sig.parameters.values():
             if p.name == 'self':
                 continue
-            f = field_map[p.name]
-            initial_type = f.type
+            initial_type = field_types[p.name]
             origin = get_origin(initial_type)
             if origin is Union:
-                type_args = get_args(f.type)
+                type_args = get_args(initial_type)
                 initial_type = type_args[0]
             if ((type(initial_type) == type and issubclass(initial_type, (int, str,
                                                                           bool,
@@ -444,6 +607,9 @@ class HikaruBase(object):
         for f in fields(self):
             self_attr = getattr(self, f.name)
             other_attr = getattr(other, f.name)
+            if self_attr is other_attr:
+                # the same object (or both None), so nothing below can differ
+                continue
             if self_attr is not None and other_attr is None:
                 diffs.append(DiffDetail(DiffType.ATTRIBUTE_ADDED, self.__class__, f.name, [f.name],
                                         f"Key added:"
@@ -474,9 +640,10 @@ class HikaruBase(object):
                                             self_attr,
                                             other_attr))
             elif isinstance(self_attr, HikaruBase):
-                inner_diffs = self_attr.diff(other_attr)
-                diffs.extend([DiffDetail(d.diff_type, d.cls, d.attrname, [f.name] + d.path,
-                                         d.report, d.value, d.other_value) for d in inner_diffs])
+                # inner diffs are freshly made, so their paths can be extended in place
+                for d in self_attr.diff(other_attr):
+                    d.path.insert(0, f.name)
+                    diffs.append(d)
             elif isinstance(self_attr, dict):
                 self_keys = set(self_attr.keys())
                 other_keys = set(other_attr.keys())
@@ -509,6 +676,8 @@ class HikaruBase(object):
                 else:
                     for i, self_element in enumerate(self_attr):
                         other_element = other_attr[i]
+                        if self_element is other_element:
+                            continue
                         if type(self_element) != type(other_element):
                             # TODO: add k to attrname and change value and other_value to be specific dict entry
                             diffs.append(DiffDetail(DiffType.TYPE_CHANGED, self.__class__, f.name,
@@ -532,11 +701,9 @@ class HikaruBase(object):
                                                 other_attr)
                                 diffs.append(dd)
                         elif isinstance(self_element, HikaruBase):
-                            inner_diffs = self_element.diff(other_element)
-                            diffs.extend([DiffDetail(d.diff_type, d.cls, d.attrname,
-                                                     [f.name, i] + d.path,
-                                                     d.report, d.value, d.other_value)
-                                          for d in inner_diffs])
+                            for d in self_element.diff(other_element):
+                                d.path[0:0] = [f.name, i]
+                                diffs.append(d)
                         else:
                             raise NotImplementedError(f"Internal error! Don't know how to "
                                                       f"compare element {self_element}"
@@ -582,38 +749,11 @@ class HikaruBase(object):
             contained objects are correct.
         """
         warnings: List[TypeWarning] = list()
-        for f in fields(self):
-            is_required = True
-            initial_type = f.type
-            origin = get_origin(initial_type)
-            if origin is Union:  # this is optional; grab what's inside
-                type_args = get_args(f.type)
-                if NoneType in type_args:
-                    is_required = False
-                    initial_type = type_args[0]
-                else:
-                    raise NotImplementedError("Internal error! We aren't expecting this "
-                                              "case. Please file a bug report.")
-            # current value of initial_type:
-            # ok, now we have either a scaler (int, bool, str, etc),
-            # a subclass of HikaruBase,
-            # or a container (Dict, List)
-            # now we want the attr's real type (scalars, dict, list, HikaruBase)
-            # and if list, we want the contained type
-            contained_type = None
-            attr_type = initial_type
-            origin = get_origin(initial_type)
-            if origin is list:
-                attr_type = list
-                contained_type = get_args(initial_type)[0]
-            elif origin is dict:
-                attr_type = dict
-            elif (type(initial_type) != type or
-                    not issubclass(initial_type, (str, int,  float,
-                                                  bool, HikaruBase))):
-                raise NotImplementedError(f"Internal error! Some other kind of type:"
-                                          f" {initial_type}, name={f.name}."
-                                          f" Please file a bug report.")
+        for f in _type_schema(self.__class__):
+            is_required = f.is_required
+            initial_type = f.initial_type
+            attr_type = f.attr_type
+            contained_type = f.contained_type
             attrval = getattr(self, f.name)
             if attrval is None:
                 if issubclass(attr_type, (str, int, float,
@@ -657,18 +797,14 @@ class HikaruBase(object):
                                                     f" {type(o).__name__},"
                                                     f" not {contained_type.__name__}"))
                     elif issubclass(contained_type, HikaruBase):
-                        # extract any warnings and amend the path
-                        inner_warnings = o.get_type_warnings()
-                        warnings.extend([TypeWarning(w.cls, w.attrname,
-                                                     [f.name, i] + w.path,
-                                                     w.warning)
-                                         for w in inner_warnings])
+                        # extract any warnings and amend their (fresh) paths
+                        for w in o.get_type_warnings():
+                            w.path[0:0] = [f.name, i]
+                            warnings.append(w)
             elif isinstance(attrval, HikaruBase):
-                inner_warnings = attrval.get_type_warnings()
-                warnings.extend([TypeWarning(w.cls, w.attrname,
-                                             [f.name] + w.path,
-                                             w.warning)
-                                 for w in inner_warnings])
+                for w in attrval.get_type_warnings():
+                    w.path.insert(0, f.name)
+                    warnings.append(w)
         return warnings
 
     def process(self, yaml) -> None:
@@ -691,13 +827,14 @@ class HikaruBase(object):
         :raises TypeError: in these if the YAML is missing a required property.
         """
 
+        field_types = _field_types(self.__class__)
         for f in fields(self.__class__):
             k8s_name = f.name.strip("_")
             is_required = True
-            initial_type = f.type
+            initial_type = field_types[f.name]
             origin = get_origin(initial_type)
             if origin is Union:  # this is optional; grab what's inside
-                type_args = get_args(f.type)
+                type_args = get_args(initial_type)
                 if NoneType in type_args:
                     is_required = False
                     initial_type = type_args[0]
@@ -713,7 +850,10 @@ class HikaruBase(object):
                 continue
             if type(initial_type) == type and issubclass(initial_type, (int, str,
                                                                         bool, float)):
-                # take as is
+                # take as is, but share one copy of the values of fields that
+                # take one of a small fixed set of values
+                if f.name in _enum_fields and type(val) is str:
+                    val = sys.intern(val)
                 setattr(self, f.name, val)
             elif is_dataclass(initial_type) and issubclass(initial_type, HikaruBase):
                 obj = initial_type.get_empty_instance()
@@ -770,6 +910,7 @@ class HikaruBase(object):
         if assign_to is not None:
             code.append(f'{assign_to} = ')
         all_fields = fields(self)
+        field_types = _field_types(self.__class__)
         sig = signature(self.__init__)
         if len(all_fields) != len(sig.parameters):
             raise NotImplementedError(f"Internal error! Uneven number of params for"
@@ -782,7 +923,7 @@ class HikaruBase(object):
         for f, p in zip(all_fields, tuple(sig.parameters.values())):
             one_param = []
             keep_param = True
-            is_required = get_origin(f.type) is not Union
+            is_required = get_origin(field_types[f.name]) is not Union
             val = getattr(self, f.name)
             if val is None and not is_required:  # should only be for optional args
                 continue
@@ -840,4 +981,5 @@ class HikaruBase(object):
 
 @dataclass
 class HikaruDocumentBase(HikaruBase):
+    __slots__ = ()
     _version = 'UNKNOWN'
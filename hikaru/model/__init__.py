@@ -28,10 +28,6 @@ a Kubernetes swagger spec into the code for the hikaru.model module.
 
 try:
     from .v1 import *
+    from .v1 import __all__
 except ImportError:
-    pass
-
-globs = dict(globals())
-__all__ = [c.__name__ for c in globs.values()
-           if type(c) == type]
-del globs
+    __all__ = []
@@ -26,47 +26,12 @@ a Kubernetes swagger spec into the code for the hikaru.model module.
 """
 
 
-from hikaru.meta import HikaruBase, HikaruDocumentBase
+from __future__ import annotations
+from hikaru.meta import HikaruBase, HikaruDocumentBase, slotted
 from typing import Optional, List, Dict
 from dataclasses import dataclass, field
 
 
-@dataclass
-class RawExtension(HikaruBase):
-    """
-    RawExtension is used to hold extensions in external versions. To use this, make a
-    field which has RawExtension as its type in your external, versioned struct, and
-    Object in your internal struct. You also need to register your various plugin types.
-    // Internal package: type MyAPIObject struct { runtime.TypeMeta `json:",inline"`
-    MyPlugin runtime.Object `json:"myPlugin"` } type PluginA struct { AOption string
-    `json:"aOption"` } // External package: type MyAPIObject struct { runtime.TypeMeta
-    `json:",inline"` MyPlugin runtime.RawExtension `json:"myPlugin"` } type PluginA struct
-    { AOption string `json:"aOption"` } // On the wire, the JSON will look something like
-    this: { "kind":"MyAPIObject", "apiVersion":"v1", "myPlugin": { "kind":"PluginA",
-    "aOption":"foo", }, } So what happens? Decode first uses json or yaml to unmarshal the
-    serialized data into your external MyAPIObject. That causes the raw JSON to be stored,
-    but not unpacked. The next step is to copy (using pkg/conversion) into the internal
-    struct. The runtime package's DefaultScheme has conversion functions installed which
-    will unpack the JSON stored in RawExtension, turning it into the correct object type,
-    and storing it in the Object. (TODO: In the case where the object is of an unknown
-    type, a runtime.Unknown object will be created and stored.)
-
-    Full name: io.k8s.apimachinery.pkg.runtime.RawExtension
-
-    Attributes:
-    """
-
-
-class IntOrString(str):
-    """
-    IntOrString is a type that can hold an int32 or a string. When used in JSON or YAML
-    marshalling and unmarshalling, it produces or consumes the inner type. This allows you
-    to have, for example, a JSON field that can accept a name or number.
-
-    Full name: io.k8s.apimachinery.pkg.util.intstr.IntOrString
-    """
-
-
 class Quantity(str):
     """
     Quantity is a fixed-point representation of a number. It provides convenient
@@ -102,6 +67,44 @@ class Quantity(str):
     """
 
 
+class IntOrString(str):
+    """
+    IntOrString is a type that can hold an int32 or a string. When used in JSON or YAML
+    marshalling and unmarshalling, it produces or consumes the inner type. This allows you
+    to have, for example, a JSON field that can accept a name or number.
+
+    Full name: io.k8s.apimachinery.pkg.util.intstr.IntOrString
+    """
+
+
+@slotted
+@dataclass
+class RawExtension(HikaruBase):
+    """
+    RawExtension is used to hold extensions in external versions. To use this, make a
+    field which has RawExtension as its type in your external, versioned struct, and
+    Object in your internal struct. You also need to register your various plugin types.
+    // Internal package: type MyAPIObject struct { runtime.TypeMeta `json:",inline"`
+    MyPlugin runtime.Object `json:"myPlugin"` } type PluginA struct { AOption string
+    `json:"aOption"` } // External package: type MyAPIObject struct { runtime.TypeMeta
+    `json:",inline"` MyPlugin runtime.RawExtension `json:"myPlugin"` } type PluginA struct
+    { AOption string `json:"aOption"` } // On the wire, the JSON will look something like
+    this: { "kind":"MyAPIObject", "apiVersion":"v1", "myPlugin": { "kind":"PluginA",
+    "aOption":"foo", }, } So what happens? Decode first uses json or yaml to unmarshal the
+    serialized data into your external MyAPIObject. That causes the raw JSON to be stored,
+    but not unpacked. The next step is to copy (using pkg/conversion) into the internal
+    struct. The runtime package's DefaultScheme has conversion functions installed which
+    will unpack the JSON stored in RawExtension, turning it into the correct object type,
+    and storing it in the Object. (TODO: In the case where the object is of an unknown
+    type, a runtime.Unknown object will be created and stored.)
+
+    Full name: io.k8s.apimachinery.pkg.runtime.RawExtension
+
+    Attributes:
+    """
+
+
+@slotted
 @dataclass
 class Info(HikaruBase):
     """
@@ -132,7 +135,7 @@ class Info(HikaruBase):
     platform: str
 
 
-globs = dict(globals())
-__all__ = [c.__name__ for c in globs.values()
-           if type(c) == type]
-del globs
+__all__ = [
+    'HikaruBase', 'HikaruDocumentBase', 'Quantity', 'IntOrString', 'RawExtension',
+    'Info'
+]
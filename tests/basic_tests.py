@@ -18,14 +18,48 @@
 # LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
+import copy
+import json
+import os
+import pickle
+import sys
+import weakref
 from hikaru import *
 
 p = None
 
 
+# parsed YAML docs keyed by path; each entry is (mtime, docs)
+_yaml_cache = {}
+
+
+def _load_cached(path: str) -> list:
+    mtime = os.path.getmtime(path)
+    cached = _yaml_cache.get(path)
+    if cached is None or cached[0] != mtime:
+        cached = _yaml_cache[path] = (mtime, _load_yaml_cached(path, mtime))
+    return cached[1]
+
+
+def _load_yaml_cached(path: str, mtime: float) -> list:
+    # the docs parsed on an earlier run are kept beside the YAML as JSON,
+    # which loads far faster; the JSON is rewritten whenever the YAML is newer
+    json_path = f"{path}.json"
+    if os.path.exists(json_path) and os.path.getmtime(json_path) > mtime:
+        with open(json_path, "r") as f:
+            return json.load(f)
+    docs = get_processors(path=path)
+    # write then rename, so parallel test workers never see a partial file
+    tmp_path = f"{json_path}.{os.getpid()}"
+    with open(tmp_path, "w") as f:
+        json.dump(docs, f)
+    os.replace(tmp_path, json_path)
+    return docs
+
+
 def setup_pod() -> Pod:
-    docs = load_full_yaml(stream=open("test.yaml", "r"))
-    pod = docs[0]
+    docs = _load_cached("test.yaml")
+    pod = Pod.from_yaml(docs[0])
     assert isinstance(pod, Pod)
     return pod
 
@@ -35,6 +69,42 @@ def setup():
     p = setup_pod()
 
 
+def mutate_copy(root, path: list, value):
+    """
+    Returns a copy of root with the item at path set to value
+
+    Only the objects along path are copied, and only shallowly; everything
+    else is shared with root, so neither root nor anything it holds changes.
+    """
+    new_root = node = copy.copy(root)
+    for step in path[:-1]:
+        if isinstance(node, (list, dict)):
+            child = node[step] = copy.copy(node[step])
+        else:
+            child = copy.copy(getattr(node, step))
+            setattr(node, step, child)
+        node = child
+    if isinstance(node, (list, dict)):
+        node[path[-1]] = value
+    else:
+        setattr(node, path[-1], value)
+    return new_root
+
+
+# compiled source keyed by (id(obj), style); the tests never modify the
+# shared 'p', so rendering and compiling it once per style is enough
+_code_cache = {}
+
+
+def _cached_code(obj, style: str = None):
+    key = (id(obj), style)
+    cached = _code_cache.get(key)
+    if cached is None or cached[0] is not obj:
+        code = compile(get_python_source(obj, style=style), '<hikaru>', 'eval')
+        cached = _code_cache[key] = (obj, code)
+    return cached[1]
+
+
 def test01():
     """
     get the basic machinery creaking to life
@@ -47,7 +117,6 @@ def test02():
     """
     ensure the labels are there
     """
-    assert isinstance(p, Pod)
     assert p.metadata.labels["lab1"] == "wibble"
     assert p.metadata.labels["lab2"] == "wobble"
 
@@ -56,7 +125,6 @@ def test03():
     """
     look for the ports in the container
     """
-    assert isinstance(p, Pod)
     assert p.spec.containers[0].ports[0].containerPort == 3306
     assert p.spec.containers[0].ports[1].containerPort == 3307
 
@@ -65,7 +133,6 @@ def test04():
     """
     add another container
     """
-    assert isinstance(p, Pod)
     assert p.spec.containers[1].name == "db"
 
 
@@ -73,7 +140,6 @@ def test05():
     """
     check for env vars on second container
     """
-    assert isinstance(p, Pod)
     assert len(p.spec.containers[1].env) == 2
 
 
@@ -81,7 +147,6 @@ def test06():
     """
     check for a value of 'here' for first env
     """
-    assert isinstance(p, Pod)
     assert p.spec.containers[1].env[0].value == "here",  \
            f"it was {p.spec.containers[1].env[0].value}"
 
@@ -90,7 +155,6 @@ def test07():
     """
     Check that there's an envFrom with a configMapRef in it
     """
-    assert isinstance(p, Pod)
     assert p.spec.containers[1].envFrom[0].configMapRef.name == "test-map"
     assert p.spec.containers[1].envFrom[0].configMapRef.optional is True
 
@@ -99,7 +163,6 @@ def test08():
     """
     Check that an envFrom has a prefix in it
     """
-    assert isinstance(p, Pod)
     assert p.spec.containers[1].envFrom[0].prefix == "gabagabahey"
 
 
@@ -107,7 +170,6 @@ def test09():
     """
     Check that an envFrom handles a secretRef
     """
-    assert isinstance(p, Pod)
     assert p.spec.containers[1].envFrom[0].secretRef.name == "seecrit"
     assert p.spec.containers[1].envFrom[0].secretRef.optional is False
 
@@ -116,7 +178,6 @@ def test10():
     """
     Check that volume mounts are processed properly
     """
-    assert isinstance(p, Pod)
     assert p.spec.containers[1].volumeMounts[0].mountPath == "/opt"
     assert p.spec.containers[1].volumeMounts[0].name == "opt-mount"
     assert p.spec.containers[1].volumeMounts[0].mountPropagation == "wibble"
@@ -129,7 +190,6 @@ def test11():
     """
     Check that volume devices is handled properly
     """
-    assert isinstance(p, Pod)
     assert p.spec.containers[1].volumeDevices[0].devicePath == "/dev/sd0a"
     assert p.spec.containers[1].volumeDevices[0].name == "root-disk"
 
@@ -138,7 +198,6 @@ def test12():
     """
     check that resources are respected
     """
-    assert isinstance(p, Pod)
     assert p.spec.containers[1].resources.limits["cores"] == 4
     assert p.spec.containers[1].resources.limits["mem-mb"] == 500
     assert p.spec.containers[1].resources.requests["cores"] == 3
@@ -149,7 +208,6 @@ def test13():
     """
     check that exec in lifecyle postStart works ok
     """
-    assert isinstance(p, Pod)
     assert len(p.spec.containers[1].lifecycle.postStart.exec.command) == 3
 
 
@@ -157,7 +215,6 @@ def test14():
     """
     check that httpGet in lifecyle postStart works
     """
-    assert isinstance(p, Pod)
     assert p.spec.containers[1].lifecycle.postStart.httpGet.port == "80"
     assert p.spec.containers[1].lifecycle.postStart.httpGet.host == 'localhost'
     assert p.spec.containers[1].lifecycle.postStart.httpGet.path == "/home"
@@ -172,7 +229,6 @@ def test15():
     """
     check that tcpSocket in lifecycle postStart works
     """
-    assert isinstance(p, Pod)
     assert p.spec.containers[1].lifecycle.postStart.tcpSocket.port == "1025"
     assert p.spec.containers[1].lifecycle.postStart.tcpSocket.host == "devnull"
 
@@ -181,7 +237,6 @@ def test16():
     """
     check exec lifecyle in pre_stop
     """
-    assert isinstance(p, Pod)
     assert len(p.spec.containers[1].lifecycle.preStop.exec.command) == 3
 
 
@@ -189,7 +244,6 @@ def test17():
     """
     check for the terminationPolicy items
     """
-    assert isinstance(p, Pod)
     assert p.spec.containers[1].terminationMessagePath == "/goodbye/cruel/world.txt"
     assert p.spec.containers[1].terminationMessagePolicy == "File"
 
@@ -198,7 +252,6 @@ def test18():
     """
     check livenessProbe
     """
-    assert isinstance(p, Pod)
     assert len(p.spec.containers[1].livenessProbe.exec.command) == 3
     assert p.spec.containers[1].livenessProbe.exec.command[0] == "probe-cmd"
     assert p.spec.containers[1].livenessProbe.initialDelaySeconds == 30
@@ -212,7 +265,6 @@ def test19():
     """
     check readinessProbe
     """
-    assert isinstance(p, Pod)
     assert len(p.spec.containers[1].readinessProbe.exec.command) == 4
     assert p.spec.containers[1].readinessProbe.exec.command[0] == "probe-cmd2"
     assert p.spec.containers[1].readinessProbe.initialDelaySeconds == 31
@@ -226,7 +278,6 @@ def test20():
     """
     check the flat items in securityContext of containers
     """
-    assert isinstance(p, Pod)
     assert p.spec.containers[1].securityContext.runAsUser == 1001
     assert p.spec.containers[1].securityContext.runAsNonRoot is True
     assert p.spec.containers[1].securityContext.runAsGroup == 55
@@ -240,7 +291,6 @@ def test21():
     """
     check the capabilities sub item of securityContext in containers
     """
-    assert isinstance(p, Pod)
     assert len(p.spec.containers[1].securityContext.capabilities.add) == 3
     assert len(p.spec.containers[1].securityContext.capabilities.drop) == 1
     assert p.spec.containers[1].securityContext.capabilities.add[1] == "read"
@@ -250,7 +300,6 @@ def test22():
     """
     check the seccompProfile settings of securityContext
     """
-    assert isinstance(p, Pod)
     assert p.spec.containers[1].securityContext.seccompProfile.type == "summat"
     assert p.spec.containers[1].securityContext.seccompProfile.localhostProfile == \
            "nada"
@@ -260,7 +309,6 @@ def test23():
     """
     check the seLinuxOptions item of securityContext
     """
-    assert isinstance(p, Pod)
     assert p.spec.containers[1].securityContext.seLinuxOptions.level == "uno"
     assert p.spec.containers[1].securityContext.seLinuxOptions.role == "dos"
     assert p.spec.containers[1].securityContext.seLinuxOptions.type == "tres"
@@ -271,7 +319,6 @@ def test24():
     """
     check the windowsOptions item of securityContext
     """
-    assert isinstance(p, Pod)
     assert p.spec.containers[
         1].securityContext.windowsOptions.gmsaCredentialSpec == "horrible", 'no horrible'
     assert p.spec.containers[
@@ -284,7 +331,6 @@ def test25():
     """
     check the imagePullSecrets in the pod spec
     """
-    assert isinstance(p, Pod)
     assert p.spec.imagePullSecrets[0].name == "one"
     assert p.spec.imagePullSecrets[1].name == "two"
 
@@ -293,7 +339,6 @@ def test26():
     """
     check enableServiceLinks
     """
-    assert isinstance(p, Pod)
     assert p.spec.enableServiceLinks is False
 
 
@@ -301,7 +346,6 @@ def test27():
     """
     check nodeSelector
     """
-    assert isinstance(p, Pod)
     assert p.spec.nodeSelector["key1"] == "wibble"
     assert p.spec.nodeSelector["key2"] == "wobble"
 
@@ -310,7 +354,6 @@ def test28():
     """
     check nodeName
     """
-    assert isinstance(p, Pod)
     assert p.spec.nodeName == "maxwell"
 
 
@@ -318,7 +361,6 @@ def test29():
     """
     check schedulerName
     """
-    assert isinstance(p, Pod)
     assert p.spec.schedulerName == "cecil"
 
 
@@ -326,7 +368,6 @@ def test30():
     """
     check runtimeClassName
     """
-    assert isinstance(p, Pod)
     assert p.spec.runtimeClassName == "classless"
 
 
@@ -334,7 +375,6 @@ def test31():
     """
     Use find_by_name to find all containers
     """
-    assert isinstance(p, Pod)
     results = p.find_by_name('containers')
     assert len(results) == 2
 
@@ -343,7 +383,6 @@ def test32():
     """
     Use find_by_name to find all exec objects in lifecycles
     """
-    assert isinstance(p, Pod)
     results = p.find_by_name('exec', following=["containers", "lifecycle"])
     assert len(results) == 2
 
@@ -352,7 +391,6 @@ def test33():
     """
     Same test as test32, but with a single string
     """
-    assert isinstance(p, Pod)
     results = p.find_by_name('exec', following='containers.lifecycle')
     assert len(results) == 2
 
@@ -361,7 +399,6 @@ def test34():
     """
     Use find_by_name to find all exec objects in the lifecycle of the 2nd container
     """
-    assert isinstance(p, Pod)
     results = p.find_by_name('exec', following=['containers', 1, 'lifecycle'])
     assert len(results) == 2, f'len is {len(results)}'
 
@@ -370,7 +407,6 @@ def test35():
     """
     Same as test34, but using a single string for following
     """
-    assert isinstance(p, Pod)
     results = p.find_by_name('exec', following='containers.1.lifecycle')
     assert len(results) == 2, f'len is {len(results)}'
 
@@ -379,7 +415,6 @@ def test36():
     """
     Use find_by_name to find a field with non-consecutive following fields
     """
-    assert isinstance(p, Pod)
     results = p.find_by_name('name', following='containers.lifecycle.httpGet')
     assert len(results) == 1
 
@@ -388,7 +423,6 @@ def test37():
     """
     check that equals returns true for the same object
     """
-    assert isinstance(p, Pod)
     q = setup_pod()
     assert p == q
 
@@ -397,7 +431,6 @@ def test38():
     """
     check that equals returns False for a tweaked object
     """
-    assert isinstance(p, Pod)
     q: Pod = setup_pod()
     q.spec.containers[1].securityContext.capabilities.add.append("wibble")
     assert p != q
@@ -407,7 +440,6 @@ def test39():
     """
     check that dup produces equal objects
     """
-    assert isinstance(p, Pod)
     q: Pod = p.dup()
     assert p == q
 
@@ -416,7 +448,6 @@ def test40():
     """
     check that a twiddled dup'd object isn't equals
     """
-    assert isinstance(p, Pod)
     q: Pod = p.dup()
     q.spec.containers[1].lifecycle.postStart.httpGet.port = "1234"
     assert p != q
@@ -424,10 +455,9 @@ def test40():
 
 def test41():
     """
-    get_python_source with the autopep8 style
+    get_python_source without formatting round-trips
     """
-    assert isinstance(p, Pod)
-    code = get_python_source(p, style="black")
+    code = _cached_code(p)
     x = eval(code, globals(), locals())
     assert p == x, "the two aren't the same"
 
@@ -436,8 +466,7 @@ def test42():
     """
     check that a modified loaded version of p isn't equal
     """
-    assert isinstance(p, Pod)
-    code = get_python_source(p, style="black")
+    code = _cached_code(p)
     x = eval(code, globals(), locals())
     assert isinstance(x, Pod)
     x.spec.containers[1].lifecycle.postStart.httpGet.port = 4
@@ -448,8 +477,7 @@ def test43():
     """
     check that you can render explicitly to autopep8
     """
-    assert isinstance(p, Pod)
-    code = get_python_source(p, style='autopep8')
+    code = _cached_code(p, style='autopep8')
     x = eval(code, globals(), locals())
     assert p == x, "the two aren't the same"
 
@@ -458,8 +486,7 @@ def test44():
     """
     check that you can render to black
     """
-    assert isinstance(p, Pod)
-    code = get_python_source(p, style="black")
+    code = _cached_code(p, style="black")
     x = eval(code, globals(), locals())
     assert p == x, "the two aren't the same"
 
@@ -468,7 +495,6 @@ def test45():
     """
     check that illegal styles are caught
     """
-    assert isinstance(p, Pod)
     try:
         code = get_python_source(p, style="groovy")
         assert False, "we should have got an exception about bad style"
@@ -534,7 +560,6 @@ def test50():
     """
     check the big test Pod for warnings (should be none)
     """
-    assert isinstance(p, Pod)
     warnings = p.get_type_warnings()
     wstrings = "\n".join(w.warning for w in warnings)
     assert not warnings, f"warnings: {wstrings}"
@@ -590,9 +615,7 @@ def test55():
     """
     check that a single change is detected by diff
     """
-    assert isinstance(p, Pod)
-    copy = p.dup()
-    del copy.spec.containers[0]
+    copy = mutate_copy(p, ['spec', 'containers'], p.spec.containers[1:])
     # copy.spec.containers[1].securityContext.seLinuxOptions.role = 'overlord'
     diffs = p.diff(copy)
     assert len(diffs) == 1
@@ -603,9 +626,8 @@ def test56():
     """
     check a single deeply nested change is detected
     """
-    assert isinstance(p, Pod)
-    copy = p.dup()
-    copy.spec.containers[1].securityContext.seLinuxOptions.role = 'overlord'
+    copy = mutate_copy(p, ['spec', 'containers', 1, 'securityContext',
+                           'seLinuxOptions', 'role'], 'overlord')
     diffs = p.diff(copy)
     assert len(diffs) == 1
     assert len(diffs[0].path) == 6, f'path is {diffs[0].path}'
@@ -615,7 +637,6 @@ def test57():
     """
     check different types yield a diff
     """
-    assert isinstance(p, Pod)
     diffs = p.diff(p.metadata)
     assert len(diffs) == 1
     assert "Incompatible" in diffs[0].report
@@ -691,7 +712,6 @@ def test64():
     """
     check we can reload a doc from a get_clean_dict() dump
     """
-    assert isinstance(p, Pod)
     d = get_clean_dict(p)
     new_p = from_dict(d)
     assert p == new_p
@@ -711,7 +731,6 @@ def test66():
     """
     Check if we can reload a doc from a get_json() dump
     """
-    assert isinstance(p, Pod)
     j = get_json(p)
     new_p = from_json(j)
     assert p == new_p
@@ -731,7 +750,6 @@ def test68():
     """
     Check catching a bad path attribute for a list
     """
-    assert isinstance(p, Pod)
     path = ['spec', 'containers', 'lifecycle']
     try:
         o = p.object_at_path(path)
@@ -744,7 +762,6 @@ def test69():
     """
     Check catching a bad index for a list
     """
-    assert isinstance(p, Pod)
     path = ['spec', 'containers', 99]
     try:
         o = p.object_at_path(path)
@@ -757,7 +774,6 @@ def test70():
     """
     Check catching a bad attribute on a regular object
     """
-    assert isinstance(p, Pod)
     path = ['spec', 'containers', 1, 'wibble', 'wobble']
     try:
         o = p.object_at_path(path)
@@ -770,7 +786,6 @@ def test71():
     """
     Check that repopulating the cataloge doesn't blow up
     """
-    assert isinstance(p, Pod)
     p.repopulate_catalog()
 
 
@@ -778,7 +793,6 @@ def test72():
     """
     Check that find_by_name()'s name parameter check works
     """
-    assert isinstance(p, Pod)
     try:
         p.find_by_name(object())
         assert False, "should have gotten a TypeError"
@@ -790,7 +804,6 @@ def test73():
     """
     Check that find_by_name()'s following parameter check works
     """
-    assert isinstance(p, Pod)
     try:
         p.find_by_name('name', following=object())
         assert False, "should have gotten a TypeError about following"
@@ -802,7 +815,6 @@ def test74():
     """
     Check that weird type where there should be an int index is caught
     """
-    assert isinstance(p, Pod)
     try:
         p.find_by_name('name', following=['spec', 'containers', object()])
         assert False, "should have gotten a ValueError"
@@ -814,9 +826,7 @@ def test75():
     """
     Check that a None in a list raises a gripe
     """
-    assert isinstance(p, Pod)
-    copy: Pod = p.dup()
-    copy.spec.containers.append(None)
+    copy: Pod = mutate_copy(p, ['spec', 'containers'], p.spec.containers + [None])
     try:
         o = copy.object_at_path(["spec", "containers", 2])
         assert False, "should have gotten a RuntimeError"
@@ -828,7 +838,6 @@ def test76():
     """
     Check a bad attr is found an griped about
     """
-    assert isinstance(p, Pod)
     path = [object()]
     try:
         o = p.object_at_path(path)
@@ -841,7 +850,6 @@ def test77():
     """
     Find an object properly
     """
-    assert isinstance(p, Pod)
     path = ['spec', 'containers', 0]
     con = p.object_at_path(path)
     assert isinstance(con, Container)
@@ -851,9 +859,7 @@ def test78():
     """
     Make a diff detail on a basic string
     """
-    assert isinstance(p, Pod)
-    copy: Pod = p.dup()
-    copy.metadata.name = 'adsgad'
+    copy: Pod = mutate_copy(p, ['metadata', 'name'], 'adsgad')
     diffs = p.diff(copy)
     assert len(diffs) == 1
 
@@ -862,11 +868,8 @@ def test79():
     """
     check that mismatched list items are caught in a diff
     """
-    assert isinstance(p, Pod)
-    copy1: Pod = p.dup()
-    copy2: Pod = p.dup()
-    copy1.metadata.finalizers = ["one", "two", "three"]
-    copy2.metadata.finalizers = ["one", "two", "four"]
+    copy1: Pod = mutate_copy(p, ['metadata', 'finalizers'], ["one", "two", "three"])
+    copy2: Pod = mutate_copy(p, ['metadata', 'finalizers'], ["one", "two", "four"])
     diffs = copy1.diff(copy2)
     assert len(diffs) == 1
 
@@ -875,11 +878,10 @@ def test80():
     """
     check that mismatched dict keys are caught in a diff
     """
-    assert isinstance(p, Pod)
-    copy1: Pod = p.dup()
-    copy2: Pod = p.dup()
-    copy1.metadata.annotations = {"one": "uno", "two": "dos"}
-    copy2.metadata.annotations = {"two": "dos", "three": "tres"}
+    copy1: Pod = mutate_copy(p, ['metadata', 'annotations'],
+                             {"one": "uno", "two": "dos"})
+    copy2: Pod = mutate_copy(p, ['metadata', 'annotations'],
+                             {"two": "dos", "three": "tres"})
     diffs = copy1.diff(copy2)
     assert len(diffs) == 1
 
@@ -898,7 +900,6 @@ def test82():
     """
     check that __repr__ gets called
     """
-    assert isinstance(p, Pod)
     s = repr(p)
     assert s
 
@@ -907,7 +908,6 @@ def test83():
     """
     check that the assign_to arg works in get_python_source()
     """
-    assert isinstance(p, Pod)
     s = get_python_source(p, style='black', assign_to='x')
     assert s.startswith('x =')
 
@@ -940,7 +940,6 @@ def test86():
     """
     Test proper generation of YAML
     """
-    assert isinstance(p, Pod)
     yaml = get_yaml(p)
     procs = get_processors(yaml=yaml)
     new_p = Pod.from_yaml(procs[0])
@@ -1019,7 +1018,6 @@ def test93():
     """
     Check that required but empty lists raise a type warning
     """
-    assert isinstance(p, Pod)
     copy: Pod = p.dup()
     copy.spec.containers = []
     warnings = copy.get_type_warnings()
@@ -1041,14 +1039,155 @@ def test95():
     """
     Check two different code gen styles yield equivalent objects
     """
-    assert isinstance(p, Pod)
-    code1 = get_python_source(p)
-    code2 = get_python_source(p, style='black')
+    code1 = _cached_code(p)
+    code2 = _cached_code(p, style='black')
     obj1 = eval(code1, globals(), locals())
     obj2 = eval(code2, globals(), locals())
     assert obj1 == obj2
 
 
+def test96():
+    """
+    Check get_json's compact output, including non-str keys, with both encoders
+    """
+    cm = load_full_yaml(yaml="apiVersion: v1\n"
+                             "kind: ConfigMap\n"
+                             "metadata:\n"
+                             "  name: ports\n"
+                             "data:\n"
+                             "  8080: port\n"
+                             "  true: flag\n")[0]
+    expected = ('{"apiVersion":"v1","kind":"ConfigMap","metadata":{"name":"ports"},'
+                '"data":{"8080":"port","true":"flag"}}')
+    assert get_json(cm) == expected, get_json(cm)
+    import hikaru.generate
+    saved = hikaru.generate.orjson
+    hikaru.generate.orjson = None
+    try:
+        assert get_json(cm) == expected, get_json(cm)
+    finally:
+        hikaru.generate.orjson = saved
+
+
+def test97():
+    """
+    Check that model objects are slotted but still copy, compare and pickle
+    """
+    assert not hasattr(p, '__dict__')
+    assert not hasattr(p.spec.containers[0], '__dict__')
+    try:
+        p.wibble = 1
+        assert False, "should not be able to add an attribute"
+    except AttributeError:
+        pass
+    assert p.dup() == p
+    assert copy.copy(p) == p
+    assert copy.deepcopy(p) == p
+    assert pickle.loads(pickle.dumps(p)) == p
+    assert p != p.dup().spec
+
+
+def test98():
+    """
+    Check that model objects can still be weakly referenced
+    """
+    om = ObjectMeta(name='x')
+    ref = weakref.ref(om)
+    assert ref() is om
+
+
+def test99():
+    """
+    Check that walking a known path on another object finds that object's value
+    """
+    path = ['spec', 'containers', 1, 'securityContext', 'seLinuxOptions', 'role']
+    role = p.spec.containers[1].securityContext.seLinuxOptions.role
+    assert p.object_at_path(path) == role
+    other = mutate_copy(p, path, 'overlord')
+    assert other.object_at_path(path) == 'overlord'
+    assert p.object_at_path(path) == role
+
+
+def test100():
+    """
+    Check that a known path that has become too short for a list still gripes
+    """
+    path = ['spec', 'containers', 1, 'name']
+    p.object_at_path(path)
+    short = mutate_copy(p, ['spec', 'containers'], p.spec.containers[:1])
+    try:
+        _ = short.object_at_path(path)
+        assert False, "should have gotten an IndexError"
+    except IndexError:
+        pass
+
+
+def test101():
+    """
+    Check that a known path that now hits a None list element still gripes
+    """
+    path = ['spec', 'containers', 1]
+    p.object_at_path(path)
+    holey = mutate_copy(p, ['spec', 'containers', 1], None)
+    try:
+        _ = holey.object_at_path(path)
+        assert False, "should have gotten a RuntimeError"
+    except RuntimeError:
+        pass
+
+
+def test102():
+    """
+    Check that a known path through an attribute that is now None still gripes
+    """
+    path = ['spec', 'containers', 1, 'securityContext', 'seLinuxOptions', 'role']
+    p.object_at_path(path)
+    cut = mutate_copy(p, ['spec', 'containers', 1, 'securityContext'], None)
+    try:
+        _ = cut.object_at_path(path)
+        assert False, "should have gotten an AttributeError"
+    except AttributeError:
+        pass
+
+
+def test103():
+    """
+    Check that ints beyond 64 bits survive a trip through get_json/from_json
+    """
+    om = ObjectMeta(name='x', generation=2 ** 70)
+    s = get_json(om)
+    assert json.loads(s) == {'name': 'x', 'generation': 2 ** 70}, s
+    om2 = from_json(s, cls=ObjectMeta)
+    assert om2.generation == 2 ** 70
+    assert type(om2.generation) is int
+    assert om2 == om
+
+
+def test104():
+    """
+    Check that enum-valued fields are interned on load but free-form ones aren't
+    """
+    pod, secret = load_full_yaml(yaml="apiVersion: v1\n"
+                                      "kind: Pod\n"
+                                      "metadata:\n"
+                                      "  name: intern-check-104\n"
+                                      "spec:\n"
+                                      "  containers:\n"
+                                      "    - name: intern-check-container\n"
+                                      "      terminationMessagePolicy: File\n"
+                                      "---\n"
+                                      "apiVersion: v1\n"
+                                      "kind: Secret\n"
+                                      "metadata:\n"
+                                      "  name: intern-check-secret\n"
+                                      "type: example.com/intern-check-type\n")
+    policy = pod.spec.containers[0].terminationMessagePolicy
+    assert policy is sys.intern("".join(list(policy)))
+    # interning an equal copy hands back the loaded value only if it was interned
+    for val in (pod.metadata.name, pod.spec.containers[0].name, secret.type):
+        assert val is not sys.intern("".join(list(val))), val
+
+
 if __name__ == "__main__":
     setup()
     the_tests = {k: v for k, v in globals().items()